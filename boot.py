@@ -32,19 +32,7 @@ spi = SPI(1, baudrate=40_000_000, sck=Pin(14), mosi=Pin(13))
 display = Display(spi, dc=Pin(2), cs=Pin(15), rst=Pin(15), rotation=0, bgr=False)
 Pin(21, Pin.OUT).on()  # Backlight on
 
-# Set up SPI and Touch
-touch_spi = SPI(2, baudrate=1_000_000, sck=Pin(25), mosi=Pin(32), miso=Pin(39))
-touch = Touch(
-    touch_spi,
-    cs=Pin(33),
-    int_pin=Pin(36),
-    int_handler=None,  # Polling > Natural interrupts
-    width=HEIGHT,  # Match display
-    height=WIDTH
-)
-
 # State machine
-touch_down = False
 button_pressed = False
 
 # --------------------------------------------------------------------------------
@@ -65,20 +53,23 @@ def draw_startup_screen():
 def is_button_pressed(x, y):
     return BUTTON_X <= x <= BUTTON_X + BUTTON_WIDTH and BUTTON_Y <= y <= BUTTON_Y + BUTTON_HEIGHT
 
-def poll_touch():
-    global touch_down, button_pressed
-
-    if touch.is_pressed():
-        if not touch_down:
-            coords = touch.get_touch()
-            if coords:
-                x, y = coords
-                print(f"Touch detected at: ({x}, {y})")
-                if is_button_pressed(x, y):
-                    button_pressed = True
-            touch_down = True
-    else:
-        touch_down = False
+def touch_handler(x, y):
+    global button_pressed
+
+    print(f"Touch detected at: ({x}, {y})")
+    if is_button_pressed(x, y):
+        button_pressed = True
+
+# Set up SPI and Touch (pen-down IRQ calls touch_handler once per press)
+touch_spi = SPI(2, baudrate=2_000_000, sck=Pin(25), mosi=Pin(32), miso=Pin(39))
+touch = Touch(
+    touch_spi,
+    cs=Pin(33),
+    int_pin=Pin(36),
+    int_handler=touch_handler,
+    width=HEIGHT,  # Match display
+    height=WIDTH
+)
 
 def cleanup():
     if touch:
@@ -92,17 +83,20 @@ def cleanup():
 
 try:
     draw_startup_screen()
-    connect_to_wifi()
 
-    while True:
-        poll_touch()
-
-        if button_pressed:
-            print("Button pressed. Starting game...")
-            break
+    # The game runs fine offline, so a failed connection is not fatal
+    try:
+        connect_to_wifi()
+    except OSError as e:
+        print(e)
 
+    # Touches are handled by the IRQ; sleeping leaves the CPU idle while
+    # still running the scheduled touch callback as soon as it fires.
+    while not button_pressed:
         sleep(0.1)
 
+    print("Button pressed. Starting game...")
+
 except KeyboardInterrupt:
     print("Program interrupted.")
 
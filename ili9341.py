@@ -120,6 +120,14 @@ class Display(object):
             self.rotation = self.MIRROR_ROTATE[mirror, rotation]
             if bgr:  # Set BGR bit
                 self.rotation |= 0b00001000
+        # Prebuilt address window (CASET x0 x1, PASET y0 y1, RAMWR); only the
+        # coordinate bytes change between block writes
+        self.window_buf = bytearray([self.SET_COLUMN, 0, 0, 0, 0,
+                                     self.SET_PAGE, 0, 0, 0, 0,
+                                     self.WRITE_RAM])
+        window = memoryview(self.window_buf)
+        self.window_parts = (window[0:1], window[1:5], window[5:6],
+                             window[6:10], window[10:11])
 
         # Initialize GPIO pins and set implementation specific methods
         if implementation.name == 'circuitpython':
@@ -136,6 +144,7 @@ class Display(object):
             self.reset = self.reset_mpy
             self.write_cmd = self.write_cmd_mpy
             self.write_data = self.write_data_mpy
+            self.block = self.block_mpy
         self.reset()
         # Send initialization commands
         self.write_cmd(self.SWRESET)  # Software reset
@@ -187,6 +196,23 @@ class Display(object):
         self.write_cmd(self.WRITE_RAM)
         self.write_data(data)
 
+    def block_mpy(self, x0, y0, x1, y1, data):
+        """Write a block of data to display (MicroPython).
+
+        Sends the address window and pixel data with CS held low throughout.
+
+        Args:
+            x0 (int):  Starting X position.
+            y0 (int):  Starting Y position.
+            x1 (int):  Ending X position.
+            y1 (int):  Ending Y position.
+            data (bytes): Data buffer to write.
+        """
+        self.cs(0)
+        self.set_window_mpy(x0, y0, x1, y1)
+        self.spi.write(data)
+        self.cs(1)
+
     def cleanup(self):
         """Clean up resources."""
         self.clear()
@@ -1003,6 +1029,41 @@ class Display(object):
                            bottom >> 8,
                            bottom & 0xFF)
 
+    def set_window_mpy(self, x0, y0, x1, y1):
+        """Send address window and memory write command (MicroPython).
+
+        CS must already be low. Leaves DC high, ready for pixel data.
+
+        Args:
+            x0 (int):  Starting X position.
+            y0 (int):  Starting Y position.
+            x1 (int):  Ending X position.
+            y1 (int):  Ending Y position.
+        """
+        buf = self.window_buf
+        buf[1] = x0 >> 8
+        buf[2] = x0 & 0xff
+        buf[3] = x1 >> 8
+        buf[4] = x1 & 0xff
+        buf[6] = y0 >> 8
+        buf[7] = y0 & 0xff
+        buf[8] = y1 >> 8
+        buf[9] = y1 & 0xff
+        caset, columns, paset, pages, ramwr = self.window_parts
+        spi = self.spi
+        dc = self.dc
+        dc(0)
+        spi.write(caset)
+        dc(1)
+        spi.write(columns)
+        dc(0)
+        spi.write(paset)
+        dc(1)
+        spi.write(pages)
+        dc(0)
+        spi.write(ramwr)
+        dc(1)
+
     def sleep(self, enable=True):
         """Enters or exits sleep mode.
 
@@ -1,41 +1,61 @@
 from machine import Pin, SPI  # type: ignore
 from ili9341 import Display, color565
 from framebuf import FrameBuffer, RGB565  # type: ignore
-from time import sleep_ms, ticks_ms, ticks_diff
-from random import randint
+from time import sleep_ms, ticks_ms, ticks_diff, ticks_add
+from random import getrandbits
 import gc
-from math import sqrt
+import micropython  # type: ignore
+from micropython import const  # type: ignore
 
 # --------------------------------------------------------------------------------
 # Global Configuration
 # --------------------------------------------------------------------------------
 
-WIDTH = 240
-HEIGHT = 320
+WIDTH = const(240)
+HEIGHT = const(320)
 
-BALL_RADIUS = 10
+BALL_RADIUS = const(10)
 ball_color = color565(0, 0, 255)  # Blue
 bg_color = color565(0, 0, 0)      # Black
 
 ANIMS = True
 ANIM_COLOR = color565(255, 0, 0)  # Red
 SIDE_ANIM_DURATION = 100          # Animation duration in ms
-
-GRAVITY = 0.025
-PLAYER_NUDGE_FORCE = 0.5
-
-FRAME_TIME = 0
+SIDE_ANIM_SIZE = const(50)        # Bar length in px
+SIDE_ANIM_WIDTH = 5               # Bar thickness in px
+# FrameBuffer stores RGB565 little-endian while fill_rectangle() sends it
+# big-endian, so the bar color is byte-swapped when drawn into a region.
+ANIM_COLOR_FB = (ANIM_COLOR & 0xFF) << 8 | ANIM_COLOR >> 8
+
+# Bounce sides; top/bottom sort before left/right
+TOP = const(0)
+BOTTOM = const(1)
+LEFT = const(2)
+RIGHT = const(3)
+
+# Velocities are Q16.16 fixed point (65536 == 1 px per frame) so the physics
+# step stays in small-int arithmetic.
+FP_SHIFT = const(16)
+FP_ONE = const(1 << 16)
+GRAVITY_FP = const(1638)          # 0.025 px/frame²
+PLAYER_NUDGE_FP = const(32768)    # 0.5 px/frame
+
+FRAME_PERIOD_MS = 8               # Target frame cadence (~120 FPS)
+SUB_STEPS = const(4)              # Physics steps per redraw
 
 ball_x = WIDTH // 2
 ball_y = HEIGHT // 2
-dx = 1
-dy = 1
+dx = FP_ONE
+dy = FP_ONE
 
 backlight = Pin(21, Pin.OUT)
 backlight.on()
 
 spi = SPI(1, baudrate=40_000_000, sck=Pin(14), mosi=Pin(13))
 display = Display(spi, dc=Pin(2), cs=Pin(15), rst=Pin(15), rotation=270, bgr=False)
+# Bound once so per-frame calls skip the attribute lookup
+_fill_rect = display.fill_rectangle
+_block = display.block
 
 # --------------------------------------------------------------------------------
 # Non-blocking Side Animation
@@ -43,6 +63,18 @@ display = Display(spi, dc=Pin(2), cs=Pin(15), rst=Pin(15), rotation=270, bgr=Fal
 
 current_anim = None
 
+# Solid bar and background strips, big-endian like fill_rectangle() sends,
+# sized for the largest bar and sliced to each bar's area; filled by
+# build_sprites()
+ANIM_PIXELS = SIDE_ANIM_SIZE * SIDE_ANIM_WIDTH
+anim_buf = memoryview(bytearray(ANIM_PIXELS * 2))
+anim_bg_buf = memoryview(bytearray(ANIM_PIXELS * 2))
+
+def fill_anim_rect(x, y, width, height, buf):
+    """Send a solid bar-sized rectangle from one of the static strips."""
+    _block(x, y, x + width - 1, y + height - 1, buf[:width * height * 2])
+
+@micropython.native
 def update_animation():
     global current_anim
     if current_anim is None:
@@ -54,55 +86,54 @@ def update_animation():
         y = current_anim['y']
         width = current_anim['width']
         height = current_anim['height']
-        display.fill_rectangle(x, y, width, height, bg_color)
+        fill_anim_rect(x, y, width, height, anim_bg_buf)
         current_anim = None
 
 def draw_side_animation_nonblocking(side, bx, by):
     global current_anim
-    gc.collect()
 
     if current_anim is not None:
-        display.fill_rectangle(
+        fill_anim_rect(
             current_anim['x'],
             current_anim['y'],
             current_anim['width'],
             current_anim['height'],
-            bg_color
+            anim_bg_buf
         )
         current_anim = None
 
-    effect_size = 50
-    if side == "left":
+    effect_size = SIDE_ANIM_SIZE
+    if side == LEFT:
         x = 0
         y = max(0, by - effect_size // 2)
-        width = 5
+        width = SIDE_ANIM_WIDTH
         height = min(effect_size, HEIGHT - y)
-    elif side == "right":
-        x = WIDTH - 5
+    elif side == RIGHT:
+        x = WIDTH - SIDE_ANIM_WIDTH
         y = max(0, by - effect_size // 2)
-        width = 5
+        width = SIDE_ANIM_WIDTH
         height = min(effect_size, HEIGHT - y)
-    elif side == "top":
+    elif side == TOP:
         x = max(0, bx - effect_size // 2)
         y = 0
         width = min(effect_size, WIDTH - x)
-        height = 5
-    elif side == "bottom":
+        height = SIDE_ANIM_WIDTH
+    elif side == BOTTOM:
         x = max(0, bx - effect_size // 2)
-        y = HEIGHT - 5
+        y = HEIGHT - SIDE_ANIM_WIDTH
         width = min(effect_size, WIDTH - x)
-        height = 5
+        height = SIDE_ANIM_WIDTH
     else:
         return
 
-    display.fill_rectangle(x, y, width, height, ANIM_COLOR)
-
+    # Painted by frame(), in the same block as the ball where possible
     current_anim = {
         'side': side,
         'x': x,
         'y': y,
         'width': width,
         'height': height,
+        'drawn': False,
         'start_time': ticks_ms()
     }
 
@@ -110,52 +141,68 @@ def draw_side_animation_nonblocking(side, bx, by):
 # Ball Update & Drawing
 # --------------------------------------------------------------------------------
 
-def fill_ball(framebuf, x0, y0, r, color):
-    r_sq = r * r
-    for dy in range(-r, r + 1):
-        yy = y0 + dy
-        dy_sq = dy * dy
-        for dx in range(-r, r + 1):
-            xx = x0 + dx
-            if dx * dx + dy_sq <= r_sq:
-                framebuf.pixel(xx, yy, color)
-
+# The ball never changes shape, so it is rasterized once into a sprite and
+# blitted each frame. Pixels left at bg_color act as the transparent key.
+BALL_SIZE = const(2 * BALL_RADIUS + 1)
+ball_buf = bytearray(BALL_SIZE * BALL_SIZE * 2)
+ball_fb = FrameBuffer(ball_buf, BALL_SIZE, BALL_SIZE, RGB565)
+
+def build_sprites():
+    """Redraw the ball sprite and bar strips; call again after changing ball/bg colors."""
+    ball_fb.fill(bg_color)
+    ball_fb.ellipse(BALL_RADIUS, BALL_RADIUS, BALL_RADIUS, BALL_RADIUS, ball_color, True)
+    anim_buf[:] = ANIM_COLOR.to_bytes(2, 'big') * ANIM_PIXELS
+    anim_bg_buf[:] = bg_color.to_bytes(2, 'big') * ANIM_PIXELS
+
+build_sprites()
+
+# Dirty regions are rendered into one preallocated buffer so the main loop
+# does not allocate a pixel buffer per frame; only a small FrameBuffer view
+# sized to each region is created.
+MAX_STEP = const(2 * SUB_STEPS)  # Typical travel per redraw, ~2 px per step
+REGION_SIDE = const(BALL_SIZE + MAX_STEP)
+# Room for a bounce bar merged with the ball box along the wall
+REGION_PIXELS = const(REGION_SIDE * (SIDE_ANIM_SIZE + MAX_STEP))
+region_buf = bytearray(REGION_PIXELS * 2)
+region_view = memoryview(region_buf)
+
+@micropython.native
 def update_ball_position(x, y, vx, vy):
-    vx += GRAVITY
-    nx, ny = int(x + vx), int(y + vy)
+    vx += GRAVITY_FP
+    nx, ny = x + (vx >> FP_SHIFT), y + (vy >> FP_SHIFT)
     bounce = None
 
     # Top/Bottom
     if ny - BALL_RADIUS < 0:
         ny, vy = BALL_RADIUS, -vy
-        bounce = "top"
+        bounce = TOP
     elif ny + BALL_RADIUS >= HEIGHT:
-        ny, vy = HEIGHT - BALL_RADIUS - 1, int(-vy * 0.9)
-        bounce = "bottom"
+        ny, vy = HEIGHT - BALL_RADIUS - 1, -(vy * 9 // 10)
+        bounce = BOTTOM
 
     # Left/Right
     if nx - BALL_RADIUS < 0:
         nx, vx = BALL_RADIUS, -vx
-        bounce = "left"
+        bounce = LEFT
     elif nx + BALL_RADIUS >= WIDTH:
-        nx, vx = WIDTH - BALL_RADIUS - 1, int(-vx * 0.9)
-        bounce = "right"
+        nx, vx = WIDTH - BALL_RADIUS - 1, -(vx * 9 // 10)
+        bounce = RIGHT
 
-    if bounce:
-        deflection = randint(-2, 2)
-        if bounce in ["top", "bottom"]:
+    if bounce is not None:
+        deflection = ((getrandbits(8) * 5 >> 8) - 2) << FP_SHIFT  # -2..2 px
+        if bounce <= BOTTOM:
             vx += deflection
-            vy = max(1, abs(vy)) * (-1 if bounce == "bottom" else 1)
-        elif bounce in ["left", "right"]:
+            vy = max(FP_ONE, abs(vy)) * (-1 if bounce == BOTTOM else 1)
+        else:
             vy += deflection
-            vx = max(1, abs(vx)) * (-1 if bounce == "right" else 1)
+            vx = max(FP_ONE, abs(vx)) * (-1 if bounce == RIGHT else 1)
 
-        vx, vy = int(vx), int(vy)
+        # Drop the fractional part, rounding toward zero
+        vx = vx >> FP_SHIFT << FP_SHIFT if vx >= 0 else -(-vx >> FP_SHIFT << FP_SHIFT)
+        vy = vy >> FP_SHIFT << FP_SHIFT if vy >= 0 else -(-vy >> FP_SHIFT << FP_SHIFT)
 
         if ANIMS:
             draw_side_animation_nonblocking(bounce, nx, ny)
-        else:
-            gc.collect()
 
     return nx, ny, vx, vy
 
@@ -164,7 +211,7 @@ def update_ball_position(x, y, vx, vy):
 # --------------------------------------------------------------------------------
 
 from xpt2046 import Touch
-touch_spi = SPI(2, baudrate=1_000_000, sck=Pin(25), mosi=Pin(32), miso=Pin(39))
+touch_spi = SPI(2, baudrate=2_000_000, sck=Pin(25), mosi=Pin(32), miso=Pin(39))
 
 # The Touch driver is created with (width=HEIGHT, height=WIDTH) because physically
 # the device might be in "landscape." But our display logic is 240 (X) × 320 (Y).
@@ -205,40 +252,116 @@ def cleanup():
 # Main
 # --------------------------------------------------------------------------------
 
+@micropython.native
+def frame():
+    """Step the ball once and push the region it moved through to the display."""
+    global ball_x, ball_y, dx, dy
+    # Sizes are const() and inlined; the remaining module globals are dict
+    # lookups, so the ones used on every redraw are bound to locals once.
+    update = update_ball_position
+    block = _block
+    bg = bg_color
+    buf = region_buf
+    view = region_view
+    sprite = ball_fb
+
+    # Several physics steps per redraw spread the fixed SPI cost over more
+    # motion; only the start and end positions need drawing.
+    new_x, new_y = ball_x, ball_y
+    for _ in range(SUB_STEPS):
+        new_x, new_y, dx, dy = update(new_x, new_y, dx, dy)
+
+    # A bar queued by a bounce is painted in the ball's block when it fits
+    anim = current_anim
+    bar = anim is not None and not anim['drawn']
+    if bar:
+        anim['drawn'] = True
+        ax, ay = anim['x'], anim['y']
+        aw, ah = anim['width'], anim['height']
+
+    if new_x != ball_x or new_y != ball_y:
+        # Inline compares instead of min()/max() builtin calls
+        if ball_x < new_x:
+            x_min, x_max = ball_x - BALL_RADIUS, new_x + BALL_RADIUS
+        else:
+            x_min, x_max = new_x - BALL_RADIUS, ball_x + BALL_RADIUS
+        if ball_y < new_y:
+            y_min, y_max = ball_y - BALL_RADIUS, new_y + BALL_RADIUS
+        else:
+            y_min, y_max = new_y - BALL_RADIUS, ball_y + BALL_RADIUS
+
+        if x_min < 0:
+            x_min = 0
+        if y_min < 0:
+            y_min = 0
+        if x_max > WIDTH - 1:
+            x_max = WIDTH - 1
+        if y_max > HEIGHT - 1:
+            y_max = HEIGHT - 1
+
+        region_width = x_max - x_min + 1
+        region_height = y_max - y_min + 1
+
+        if region_width * region_height > REGION_PIXELS:
+            # Moved too far for one region: clear the old ball separately
+            _fill_rect(ball_x - BALL_RADIUS, ball_y - BALL_RADIUS, BALL_SIZE, BALL_SIZE, bg)
+            x_min, y_min = new_x - BALL_RADIUS, new_y - BALL_RADIUS
+            x_max, y_max = new_x + BALL_RADIUS, new_y + BALL_RADIUS
+            region_width = region_height = BALL_SIZE
+
+        if bar:
+            ux_min = ax if ax < x_min else x_min
+            uy_min = ay if ay < y_min else y_min
+            ux_max = ax + aw - 1 if ax + aw - 1 > x_max else x_max
+            uy_max = ay + ah - 1 if ay + ah - 1 > y_max else y_max
+            if (ux_max - ux_min + 1) * (uy_max - uy_min + 1) <= REGION_PIXELS:
+                x_min, y_min, x_max, y_max = ux_min, uy_min, ux_max, uy_max
+                region_width = x_max - x_min + 1
+                region_height = y_max - y_min + 1
+            else:
+                fill_anim_rect(ax, ay, aw, ah, anim_buf)
+                bar = False
+
+        fb = FrameBuffer(buf, region_width, region_height, RGB565)
+        fb.fill(bg)
+        if bar:
+            fb.fill_rect(ax - x_min, ay - y_min, aw, ah, ANIM_COLOR_FB)
+
+        fb.blit(sprite, new_x - x_min - BALL_RADIUS, new_y - y_min - BALL_RADIUS, bg)
+
+        # SPI.write blocks until the transfer completes (the ESP32 port
+        # DMAs internally but exposes no async write), so a second region
+        # buffer would have nothing to overlap with.
+        block(x_min, y_min, x_max, y_max,
+              view[:region_width * region_height * 2])
+
+        ball_x, ball_y = new_x, new_y
+
+    elif bar:
+        fill_anim_rect(ax, ay, aw, ah, anim_buf)
+
+# Let the GC run on its own once a quarter of the free heap has been
+# allocated, rather than forcing full collections on every bounce.
+gc.collect()
+gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
+
 try:
     display.fill_rectangle(0, 0, WIDTH, HEIGHT, bg_color)
 
+    next_tick = ticks_ms()
     while True:
         poll_touch()
-
-        new_x, new_y, dx, dy = update_ball_position(ball_x, ball_y, dx, dy)
-
-        if new_x != ball_x or new_y != ball_y:
-            x_min = min(ball_x, new_x) - BALL_RADIUS
-            y_min = min(ball_y, new_y) - BALL_RADIUS
-            x_max = max(ball_x, new_x) + BALL_RADIUS
-            y_max = max(ball_y, new_y) + BALL_RADIUS
-
-            x_min, y_min = max(0, x_min), max(0, y_min)
-            x_max, y_max = min(WIDTH - 1, x_max), min(HEIGHT - 1, y_max)
-
-            region_width = x_max - x_min + 1
-            region_height = y_max - y_min + 1
-
-            region_buf = bytearray(region_width * region_height * 2)
-            fb = FrameBuffer(region_buf, region_width, region_height, RGB565)
-            fb.fill(bg_color)
-
-            offset_x = new_x - x_min
-            offset_y = new_y - y_min
-            fill_ball(fb, offset_x, offset_y, BALL_RADIUS, ball_color)
-
-            display.block(x_min, y_min, x_max, y_max, region_buf)
-
-            ball_x, ball_y = new_x, new_y
-
+        frame()
         update_animation()
-        sleep_ms(FRAME_TIME)
+
+        # Sleep off what is left of the frame; when running late, resync
+        # to now rather than bursting to catch up.
+        next_tick = ticks_add(next_tick, FRAME_PERIOD_MS)
+        delay = ticks_diff(next_tick, ticks_ms())
+        if delay > 0:
+            sleep_ms(delay)
+        else:
+            next_tick = ticks_ms()
 
 except KeyboardInterrupt:
     display.cleanup()
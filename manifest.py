@@ -0,0 +1,9 @@
+# Freezes AutoPong into custom ESP32 firmware, e.g. from ports/esp32:
+#   make BOARD=ESP32_GENERIC FROZEN_MANIFEST=/path/to/AutoPong/manifest.py
+include("$(PORT_DIR)/boards/manifest.py")
+
+module("ili9341.py", opt=3)
+module("xpt2046.py", opt=3)
+module("wifi.py", opt=3)
+module("memory.py", opt=3)
+module("main.py", opt=3)
@@ -4,8 +4,8 @@ def free_disk():
   s = os.statvfs('//')
   return ('{0}MB disk space free'.format((s[0]*s[3])/1048576))
 
-def free_memory(full=False):
-  gc.collect()
+def free_memory(full=False, collect=False):
+  if collect: gc.collect()
 
   free = gc.mem_free()
   allocated = gc.mem_alloc()
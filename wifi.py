@@ -1,7 +1,9 @@
 import network # type: ignore
+from time import sleep_ms, ticks_ms, ticks_diff
 
 SSID = 'BT-69CPT3-LEGACY'
 KEY = 'CFXTPYLWMM'
+CONNECT_TIMEOUT_MS = 15_000
 
 def connect_to_wifi():
     """Connect to a defined wireless network."""
@@ -12,8 +14,12 @@ def connect_to_wifi():
         print(f'WiFi --> Connecting to {SSID}...')
 
         wlan.connect(SSID, KEY)
+        start = ticks_ms()
         while not wlan.isconnected():
-            pass
+            if ticks_diff(ticks_ms(), start) > CONNECT_TIMEOUT_MS:
+                wlan.disconnect()
+                raise OSError(f'WiFi --> Timed out connecting to {SSID}')
+            sleep_ms(100)
 
     print(f'WiFi --> Connected to {SSID} - IPv4 {wlan.ipconfig('addr4')[0]}')
     return wlan
\ No newline at end of file
@@ -4,9 +4,10 @@ XPT2046 Touch module (Non-Blocking Modified).
 
 from time import sleep
 try:
-    from micropython import const
+    from micropython import const, schedule
 except ImportError:
     def const(x): return x
+    def schedule(func, arg): func(arg)
 
 class Touch(object):
     """Serial interface for XPT2046 Touch Screen Controller."""
@@ -53,6 +54,12 @@ class Touch(object):
         self.cs.init(self.cs.OUT, value=1)
         self.rx_buf = bytearray(3)
         self.tx_buf = bytearray(3)
+        # X and Y in one transfer: the Y command overlaps X's last byte
+        self.xy_rx_buf = bytearray(5)
+        self.xy_tx_buf = bytearray([self.GET_X, 0, self.GET_Y, 0, 0])
+        # Sample from the latest is_pressed(), reused by get_touch() until
+        # the next poll
+        self.last_raw = None
         self.width = width
         self.height = height
 
@@ -62,40 +69,67 @@ class Touch(object):
         self.y_min = y_min
         self.y_max = y_max
 
-        # Convert raw ADC to screen coords
-        self.x_multiplier = width / (x_max - x_min)
-        self.x_add = x_min * -self.x_multiplier
-        self.y_multiplier = height / (y_max - y_min)
-        self.y_add = y_min * -self.y_multiplier
+        # Integer spans so normalize() maps x_min..x_max exactly to 0..width
+        self.x_range = x_max - x_min
+        self.y_range = y_max - y_min
 
-        # If int_pin is used, configure it (but we won't rely on interrupts now)
+        # Pen-down IRQ is only armed when a handler is given; otherwise poll
+        self.int_pin = int_pin
         if int_pin is not None:
-            self.int_pin = int_pin
             self.int_pin.init(int_pin.IN)
         self.int_handler = int_handler
         self.int_locked = False
+        if int_pin is not None and int_handler is not None:
+            self.int_read_cb = self.int_read  # Bind once, not inside the IRQ
+            self.int_pin.irq(trigger=int_pin.IRQ_FALLING | int_pin.IRQ_RISING,
+                             handler=self.int_press)
 
     def get_touch(self):
         """
         Non-blocking approach: Try ONE quick reading.
         Returns (x, y) if valid, or None if no valid touch is detected.
         """
-        sample = self.raw_touch()
+        sample = self.last_raw
+        self.last_raw = None
+        if sample is None:
+            sample = self.raw_touch()
         if sample is None:
             return None  # No valid reading
         x, y = self.normalize(*sample)
         return (x, y)
 
+    def int_press(self, pin):
+        """Pen IRQ: schedule one read on pen-down, re-arm on pen-up.
+
+        SPI access is deferred with micropython.schedule so nothing is read
+        or allocated in interrupt context.
+        """
+        if not pin.value() and not self.int_locked:
+            self.int_locked = True
+            schedule(self.int_read_cb, None)
+        elif pin.value() and self.int_locked:
+            self.int_locked = False
+
+    def int_read(self, _):
+        """Scheduled from int_press: read the touch and call int_handler(x, y)."""
+        coords = self.get_touch()
+        if coords is not None:
+            self.int_handler(*coords)
+
     def normalize(self, x, y):
         """Map raw ADC values to screen coordinates."""
-        x = int(self.x_multiplier * x + self.x_add)
-        y = int(self.y_multiplier * y + self.y_add)
+        x = (x - self.x_min) * self.width // self.x_range
+        y = (y - self.y_min) * self.height // self.y_range
         return (x, y)
 
     def raw_touch(self):
         """Read raw X,Y touch values. Returns (x, y) or None if out of range."""
-        x = self.send_command(self.GET_X)
-        y = self.send_command(self.GET_Y)
+        rx = self.xy_rx_buf
+        self.cs(0)
+        self.spi.write_readinto(self.xy_tx_buf, rx)
+        self.cs(1)
+        x = (rx[1] << 4) | (rx[2] >> 4)
+        y = (rx[3] << 4) | (rx[4] >> 4)
         # Check if within calibrated range
         if self.x_min <= x <= self.x_max and self.y_min <= y <= self.y_max:
             return (x, y)
@@ -114,6 +148,12 @@ class Touch(object):
 
     def is_pressed(self):
         """
-        Returns True if the pen is - likely - down. Partly guessing by reading X/Y.
+        Returns True if the pen is - likely - down. Uses the PENIRQ level when
+        int_pin is wired, otherwise guesses by reading X/Y.
         """
-        return (self.raw_touch() is not None)
\ No newline at end of file
+        # Only the sample from this poll may be reused by get_touch()
+        self.last_raw = None
+        if self.int_pin is not None:
+            return self.int_pin.value() == 0
+        self.last_raw = self.raw_touch()
+        return (self.last_raw is not None)
\ No newline at end of file